@@ -6,29 +6,48 @@ A command-line based tool designed to generate cryptographically secure password
 locally, without relying on any external services.
 """
 
+import os
 import secrets
 import string
-import argparse
 import sys
 import datetime
+import time
 import random
-
-from cryptography.fernet import Fernet
-
+import functools
 import hashlib
-import requests
+import binascii
 import math
 
-try:
-    from colorama import init, Fore, Style
-    COLORAMA_AVAILABLE = True
+# Heavier dependencies (colorama, numpy, requests, cryptography) are imported
+# on first use so that plain password generation starts quickly.
+
+@functools.lru_cache(maxsize=None)
+def _ensure_colorama():
+    """Import and initialize colorama, returning (styles, Fore, Style) or None if unavailable."""
+    try:
+        from colorama import init, Fore, Style
+    except ImportError:
+        return None
     init()  # Initialize colorama
-except ImportError:
-    COLORAMA_AVAILABLE = False
+    # Precompute the escape prefix for every color/bold combination
+    styles = {
+        (color, bold): (Style.BRIGHT if bold else "") + getattr(Fore, color.upper())
+        for color in ('black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white')
+        for bold in (False, True)
+    }
+    return styles, Fore, Style
 
+@functools.lru_cache(maxsize=None)
+def _load_numpy():
+    """Import numpy, returning None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
-def get_logo():
-    return r"""
+
+_BIG_LOGO = r"""
   _____                           _____            
  |  __ \                        / ____|           
  | |__) |_ _ ___ ___  ___ _ __ | |  __  ___ _ __  
@@ -45,11 +64,16 @@ def get_logo():
    \___) (___/  
        """
 
+_SMALL_LOGO = "PassenGen - Secure Passwords"
+
+def get_logo():
+    return _BIG_LOGO
+
 def get_small_logo():
-    return "PassenGen - Secure Passwords"
+    return _SMALL_LOGO
 
 def print_logo(small=False):
-    logo = get_small_logo() if small else get_logo()
+    logo = _SMALL_LOGO if small else _BIG_LOGO
     print_colored(logo, "cyan", bold=True)
 
 def interactive_options():
@@ -87,6 +111,105 @@ def interactive_options():
 MIN_PASSWORD_LENGTH = 12
 DEFAULT_PASSWORD_LENGTH = 16
 
+# Alphabets for every combination of character sets, keyed by a bitmask:
+# bit 0 = lowercase, bit 1 = uppercase, bit 2 = digits, bit 3 = specials
+_CHARSETS = (string.ascii_lowercase, string.ascii_uppercase, string.digits, string.punctuation)
+_ALPHABETS = {}
+for _mask in range(1, 16):
+    _ALPHABETS[_mask] = ''.join(chars for bit, chars in enumerate(_CHARSETS) if _mask & (1 << bit))
+del _mask
+
+
+def _alphabet_mask(use_lowercase, use_uppercase, use_digits, use_specials):
+    """Pack the character set flags into the key used by _ALPHABETS."""
+    return (bool(use_lowercase) | bool(use_uppercase) << 1
+            | bool(use_digits) << 2 | bool(use_specials) << 3)
+
+
+@functools.lru_cache(maxsize=16)
+def _byte_tables(alphabet):
+    """
+    Build the translate table and rejection set for mapping random bytes
+    onto an alphabet without modulo bias.
+
+    Bytes at or above the largest multiple of len(alphabet) that fits in a
+    byte are rejected, so every character is equally likely.
+    """
+    encoded = alphabet.encode('ascii')
+    size = len(encoded)
+    limit = 256 - (256 % size)
+    table = bytes(encoded[i % size] for i in range(256))
+    rejected = bytes(range(limit, 256))
+    return table, rejected
+
+@functools.lru_cache(maxsize=16)
+def _seeded_byte_tables(alphabet):
+    """
+    Build the translate table and rejection set that replay random.Random.choice
+    from the top byte of each 32-bit generator output.
+
+    choice() keeps the top n.bit_length() bits of one output per attempt and
+    rejects values >= len(alphabet); alphabets are shorter than 256 characters,
+    so those bits always sit in the top byte.
+    """
+    encoded = alphabet.encode('ascii')
+    size = len(encoded)
+    shift = 8 - size.bit_length()
+    table = bytes(encoded[b >> shift] if (b >> shift) < size else 0 for b in range(256))
+    rejected = bytes(b for b in range(256) if (b >> shift) >= size)
+    return table, rejected
+
+def _sample_chars_seeded(random_gen, alphabet, count):
+    """
+    Draw `count` characters exactly as repeated random_gen.choice(alphabet) would.
+
+    Each round requests one 32-bit output per missing character, so the
+    generator is advanced by the same amount as the equivalent choice() calls.
+    """
+    table, rejected = _seeded_byte_tables(alphabet)
+    out = bytearray()
+    while len(out) < count:
+        need = count - len(out)
+        raw = random_gen.getrandbits(32 * need).to_bytes(4 * need, 'little')
+        # Every fourth byte is the most significant byte of one output
+        out += raw[3::4].translate(table, rejected)
+    return out.decode('ascii')
+
+def _sample_from_tables(table, rejected, count, bound=0):
+    """
+    Draw `count` characters by mapping bulk OS randomness through tables from _byte_tables.
+
+    If `bound` (at most 256) is given, the first byte of each buffer is reserved
+    for a uniform position in [0, bound), and (chars, position) is returned.
+    """
+    mask = (1 << (bound - 1).bit_length()) - 1 if bound else 0
+    position = None if bound else 0
+    out = bytearray()
+    while len(out) < count or position is None:
+        raw = secrets.token_bytes(max(count * 2, 32))
+        if position is None:
+            # Mask to the smallest covering power of two and reject values out of range
+            if raw[0] & mask < bound:
+                position = raw[0] & mask
+            raw = raw[1:]
+        out += raw.translate(table, rejected)
+    chars = out[:count].decode('ascii')
+    return (chars, position) if bound else chars
+
+def _sample_chars(alphabet, count):
+    """Draw `count` uniformly distributed characters from `alphabet` using bulk OS randomness."""
+    table, rejected = _byte_tables(alphabet)
+    return _sample_from_tables(table, rejected, count)
+
+
+# The default options (every character set, no forced word, no seed) get a
+# specialized path with the alphabet tables resolved once at import
+_FAST_DEFAULT_ALPHABET = _ALPHABETS[15]
+_FAST_DEFAULT_TABLE, _FAST_DEFAULT_REJECTED = _byte_tables(_FAST_DEFAULT_ALPHABET)
+
+def _fast_default(length):
+    """Generate a password from the full default alphabet."""
+    return _sample_from_tables(_FAST_DEFAULT_TABLE, _FAST_DEFAULT_REJECTED, length)
 
 def generate_password(length=DEFAULT_PASSWORD_LENGTH, use_specials=True, 
                       use_digits=True, use_uppercase=True, use_lowercase=True,
@@ -106,79 +229,223 @@ def generate_password(length=DEFAULT_PASSWORD_LENGTH, use_specials=True,
     Returns:
         str: Generated password
     """
-    # Validate that at least one character set is selected
-    if not any([use_specials, use_digits, use_uppercase, use_lowercase]):
-        raise ValueError("At least one character set must be enabled")
+    if use_specials and use_digits and use_uppercase and use_lowercase and not force_word and not seed:
+        return _fast_default(length)
     
-    # Build the alphabet based on selected options
-    alphabet = ""
-    if use_lowercase:
-        alphabet += string.ascii_lowercase
-    if use_uppercase:
-        alphabet += string.ascii_uppercase
-    if use_digits:
-        alphabet += string.digits
-    if use_specials:
-        alphabet += string.punctuation
+    # Look up the precomputed alphabet for the selected options
+    mask = _alphabet_mask(use_lowercase, use_uppercase, use_digits, use_specials)
+    if not mask:
+        raise ValueError("At least one character set must be enabled")
+    alphabet = _ALPHABETS[mask]
     
-    # Determine choice function based on seed or secrets
+    # Determine sampling function based on seed or secrets
     if seed:
         random_gen = random.Random(seed)
-        choice_func = random_gen.choice
+        sample_func = functools.partial(_sample_chars_seeded, random_gen, alphabet)
     else:
-        choice_func = secrets.choice
+        sample_func = functools.partial(_sample_chars, alphabet)
     
     # Generate the password
     if force_word:
         if len(force_word) > length:
             raise ValueError("Forced word cannot be longer than password length.")
         base_length = length - len(force_word)
-        password = ''.join(choice_func(alphabet) for _ in range(base_length))
-        insert_pos = random_gen.randint(0, len(password)) if seed else secrets.randbelow(len(password) + 1)
-        password = password[:insert_pos] + force_word + password[insert_pos:]
+        if seed:
+            chars = sample_func(base_length)
+            insert_pos = random_gen.randint(0, base_length)
+        elif base_length < 256:
+            # Take the position from the same random buffer as the characters
+            table, rejected = _byte_tables(alphabet)
+            chars, insert_pos = _sample_from_tables(table, rejected, base_length, base_length + 1)
+        else:
+            chars = sample_func(base_length)
+            insert_pos = secrets.randbelow(base_length + 1)
+        password = ''.join([chars[:insert_pos], force_word, chars[insert_pos:]])
     else:
-        password = ''.join(choice_func(alphabet) for _ in range(length))
+        password = sample_func(length)
     
     return password
 
+def generate_passwords_batch(count, length=DEFAULT_PASSWORD_LENGTH, use_specials=True,
+                             use_digits=True, use_uppercase=True, use_lowercase=True):
+    """
+    Generate many cryptographically secure passwords in one pass.
+    
+    All randomness is drawn in bulk and mapped onto the alphabet with
+    NumPy when it is available, falling back to the byte sampler otherwise.
+    
+    Args:
+        count (int): Number of passwords to generate
+        length (int): Length of each password
+        use_specials (bool): Include special characters
+        use_digits (bool): Include digits
+        use_uppercase (bool): Include uppercase letters
+        use_lowercase (bool): Include lowercase letters
+        
+    Returns:
+        list: Generated passwords
+    """
+    mask = _alphabet_mask(use_lowercase, use_uppercase, use_digits, use_specials)
+    if not mask:
+        raise ValueError("At least one character set must be enabled")
+    alphabet = _ALPHABETS[mask]
+    total = count * length
+    if total <= 0:
+        return [""] * count
+    
+    np = _load_numpy()
+    if np is None:
+        chars = _sample_chars(alphabet, total)
+    else:
+        encoded = np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)
+        size = len(encoded)
+        limit = 256 - (256 % size)
+        
+        # Reject biased bytes as a masked op, drawing more until we have enough
+        chunks = []
+        drawn = 0
+        while drawn < total:
+            raw = np.frombuffer(secrets.token_bytes(max((total - drawn) * 2, 32)), dtype=np.uint8)
+            raw = raw[raw < limit]
+            chunks.append(raw)
+            drawn += raw.size
+        indices = np.concatenate(chunks)[:total].reshape(count, length)
+        
+        # Decode the contiguous (count, length) block in one call rather than row by row
+        chars = encoded[indices % size].tobytes().decode('ascii')
+    
+    return [chars[i:i + length] for i in range(0, total, length)]
+
+HIBP_TIMEOUT = 5
+
+@functools.lru_cache(maxsize=None)
+def _get_hibp_session():
+    """Return the shared HIBP session so repeated lookups reuse the same TLS connection."""
+    import requests
+    session = requests.Session()
+    # Padding hides the real response size; padded entries have a count of 0
+    session.headers['Add-Padding'] = 'true'
+    return session
+
 def is_password_pwned(password):
-    sha1pwd = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
-    prefix, suffix = sha1pwd[:5], sha1pwd[5:]
+    sha1pwd = binascii.hexlify(hashlib.sha1(password.encode('utf-8')).digest()).upper()
+    prefix, suffix = sha1pwd[:5].decode('ascii'), sha1pwd[5:]
     url = f"https://api.pwnedpasswords.com/range/{prefix}"
-    response = requests.get(url)
+    response = _get_hibp_session().get(url, timeout=HIBP_TIMEOUT)
     
     if response.status_code != 200:
         raise RuntimeError("Error fetching data from HIBP API.")
     
-    hashes = (line.split(':') for line in response.text.splitlines())
-    return any(h == suffix for h, _ in hashes)
-
-def get_rotation_recommendation():
-    created_at = datetime.datetime.now()
+    # Locate the suffix at the start of a line with a single C-level search,
+    # working on the raw bytes to skip decoding the whole body
+    body = response.content
+    needle = suffix + b":"
+    if body.startswith(needle):
+        idx = 0
+    else:
+        idx = body.find(b"\n" + needle)
+        if idx == -1:
+            return False
+        idx += 1
+    
+    # Padding entries carry a count of 0
+    start = idx + len(needle)
+    end = body.find(b"\n", start)
+    count = body[start:end] if end != -1 else body[start:]
+    return count.strip() != b'0'
+
+def is_passwords_pwned(passwords, max_workers=8):
+    """Check several passwords against HIBP concurrently, preserving input order."""
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(is_password_pwned, passwords))
+
+@functools.lru_cache(maxsize=2)
+def _rotation_dates(epoch_sec):
+    created_at = datetime.datetime.fromtimestamp(epoch_sec)
     rotate_after_days = 90
     next_rotation = created_at + datetime.timedelta(days=rotate_after_days)
     return created_at.strftime("%Y-%m-%d"), next_rotation.strftime("%Y-%m-%d")
 
+def get_rotation_recommendation():
+    # Dates only change once a day, so format them at most once per second
+    return _rotation_dates(int(time.time()))
+
+def format_colored(text, color=None, bold=False):
+    """Return text wrapped in color codes if colorama is available."""
+    colorama = _ensure_colorama() if color else None
+    if colorama is None:
+        return text
+    styles, fore, style = colorama
+    prefix = styles.get((color, bold))
+    if prefix is None:
+        # Resolve any other spelling or Fore attribute once and cache it
+        prefix = styles[(color, bold)] = (style.BRIGHT if bold else "") + getattr(fore, color.upper(), "")
+    return prefix + text + style.RESET_ALL
+
 def print_colored(text, color=None, bold=False):
     """Print colored text if colorama is available."""
-    if COLORAMA_AVAILABLE and color:
-        color_code = getattr(Fore, color.upper(), "")
-        style_code = Style.BRIGHT if bold else ""
-        print(f"{style_code}{color_code}{text}{Style.RESET_ALL}")
-    else:
-        print(text)
+    print(format_colored(text, color, bold))
+
+def write_lines(lines):
+    """Write a batch of already formatted lines to stdout in a single call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
 
-def save_password_encrypted(password, filepath="saved_passwords.enc"):
+# Keys stay in their own file, readable only by the owner where supported
+KEY_FILE_MODE = 0o600
+
+def _write_file(path, data, mode=None):
+    """
+    Write data to path with one open and (normally) one write, bypassing buffered file objects.
+
+    If `mode` is given it is enforced even when the file already exists,
+    since os.open only applies it to newly created files.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666 if mode is None else mode)
+    try:
+        if mode is not None and hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _make_cipher():
+    """Generate a fresh Fernet key and return it with its cipher."""
+    from cryptography.fernet import Fernet
     key = Fernet.generate_key()
-    cipher = Fernet(key)
+    return key, Fernet(key)
+
+def save_password_encrypted(password, filepath="saved_passwords.enc", cipher=None, key=None):
+    """Encrypt a password and save it alongside its key, reusing `cipher`/`key` if given."""
+    if (cipher is None) != (key is None):
+        raise ValueError("cipher and key must be given together")
+    if cipher is None:
+        key, cipher = _make_cipher()
     encrypted = cipher.encrypt(password.encode())
-    with open(filepath, "wb") as file:
-        file.write(encrypted)
-    with open(filepath + ".key", "wb") as keyfile:
-        keyfile.write(key)
+    _write_file(filepath, encrypted)
+    _write_file(filepath + ".key", key, KEY_FILE_MODE)
     print_colored(f"Password encrypted and saved to {filepath}", "cyan")
     print_colored(f"Encryption key saved to {filepath}.key (Keep it safe!)", "cyan")
 
+def save_passwords_encrypted(passwords, filepath="saved_passwords.enc"):
+    """
+    Encrypt many passwords with one key and save them to a single file.
+    
+    Each ciphertext is stored with a 4-byte big-endian length prefix.
+    """
+    key, cipher = _make_cipher()
+    records = []
+    for password in passwords:
+        encrypted = cipher.encrypt(password.encode())
+        records.append(len(encrypted).to_bytes(4, "big") + encrypted)
+    _write_file(filepath, b"".join(records))
+    _write_file(filepath + ".key", key, KEY_FILE_MODE)
+    print_colored(f"Passwords encrypted and saved to {filepath}", "cyan")
+    print_colored(f"Encryption key saved to {filepath}.key (Keep it safe!)", "cyan")
+
 def save_to_revoked_list(password, filename="revoked_passwords.txt"):
     with open(filename, "a") as file:
         file.write(password + "\n")
@@ -198,6 +465,12 @@ def calculate_entropy(length, charset_size):
 def main():
     """Main function to handle CLI arguments and generate passwords."""
     print_logo()
+
+    # No arguments means interactive mode, which never needs argparse
+    if len(sys.argv) == 1:
+        return _run_interactive()
+
+    import argparse
     parser = argparse.ArgumentParser(
         description="PassenGen - Secure Password Generator",
         epilog="Generates cryptographically secure passwords locally."
@@ -224,7 +497,11 @@ def main():
 
         sys.exit(0)
     
-    # Interactive password generation mode (default)
+    return _run_interactive()
+
+
+def _run_interactive():
+    """Interactive password generation mode (default)."""
     options = interactive_options()
 
     proof_mode = input("\nEnable Proof-of-Randomness mode? (y/n): ").lower() == 'y'
@@ -259,38 +536,41 @@ def main():
             print_colored("\n⚠️ Failed to generate a non-revoked password after multiple attempts. Try different settings.", "red", bold=True)
             sys.exit(1)
 
-    charset_size = 0
-    if options['use_lowercase']:
-        charset_size += 26
-    if options['use_uppercase']:
-        charset_size += 26
-    if options['use_digits']:
-        charset_size += 10
-    if options['use_specials']:
-        charset_size += len(string.punctuation)
+    charset_size = len(_ALPHABETS[_alphabet_mask(
+        options['use_lowercase'], options['use_uppercase'],
+        options['use_digits'], options['use_specials']
+    )])
 
     entropy = calculate_entropy(len(password), charset_size)
-    print_colored(f"\nEstimated Password Entropy: {entropy} bits", "magenta")
 
-    print_colored("\nGenerated Password:", "yellow")
-    print_colored(password, "green", bold=True)
+    # Collect the report and emit it in as few writes as possible
+    out = [
+        format_colored(f"\nEstimated Password Entropy: {entropy} bits", "magenta"),
+        format_colored("\nGenerated Password:", "yellow"),
+        format_colored(password, "green", bold=True),
+    ]
 
     if proof_mode:
-        print_colored(f"\nProof-of-Randomness Seed:\n{seed}", "cyan")
+        out.append(format_colored(f"\nProof-of-Randomness Seed:\n{seed}", "cyan"))
         password_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
-        print_colored(f"Password SHA-256 Hash:\n{password_hash}", "cyan")
+        out.append(format_colored(f"Password SHA-256 Hash:\n{password_hash}", "cyan"))
+
+    # Show the password before waiting on the network
+    write_lines(out)
+    out = []
 
     try:
         if is_password_pwned(password):
-            print_colored("\n⚠️ Warning: This password has been found in known data breaches! Consider regenerating.", "red", bold=True)
+            out.append(format_colored("\n⚠️ Warning: This password has been found in known data breaches! Consider regenerating.", "red", bold=True))
         else:
-            print_colored("\n✅ Password not found in known breaches.", "green")
+            out.append(format_colored("\n✅ Password not found in known breaches.", "green"))
     except Exception as e:
-        print_colored(f"\n⚠️ Could not verify password breach status: {str(e)}", "yellow")
+        out.append(format_colored(f"\n⚠️ Could not verify password breach status: {str(e)}", "yellow"))
 
     created_at, next_rotation = get_rotation_recommendation()
-    print_colored(f"\nPassword Created On: {created_at}", "blue")
-    print_colored(f"Recommended Rotation By: {next_rotation}", "blue")
+    out.append(format_colored(f"\nPassword Created On: {created_at}", "blue"))
+    out.append(format_colored(f"Recommended Rotation By: {next_rotation}", "blue"))
+    write_lines(out)
 
     save_choice = input("\nDo you want to save this password encrypted locally? (y/n): ").lower()
     if save_choice == 'y':
@@ -298,8 +578,10 @@ def main():
 
     save_to_revoked_list(password)
 
-    print("\nPassword generated using cryptographically secure methods.")
-    print("This tool operates completely offline for your security.")
+    write_lines([
+        "\nPassword generated using cryptographically secure methods.",
+        "This tool operates completely offline for your security.",
+    ])
     sys.exit(0)
 
 